@@ -19,9 +19,10 @@ This module contains the GitHubRepository class that is used to interact with th
 """
 
 import logging
-import sys
 import requests
 
+from release_notes_presence_check.utils.gh_action import set_action_failed
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,12 +50,16 @@ class GitHubRepository:
         """
         Get Pull Request information for the repository.
 
-        @return: A Pull Request object representing the PR.
+        @param pr_number: The number of the Pull Request
+        @return: A Pull Request object representing the PR, extended with a `label_names` set.
         """
         pr_url = f"https://api.github.com/repos/{self.owner}/{self.repo}/pulls/{pr_number}"
         response = requests.get(pr_url, headers=self.headers, timeout=5)
         if response.status_code != 200:
-            logger.error("Error fetching PR details. Status code: %s", response.status_code)
-            sys.exit(1)
+            message = f"Error fetching PR details. Status code: {response.status_code}"
+            logger.error(message)
+            set_action_failed(message)
 
-        return response.json()
+        pr_info: dict = response.json()
+        pr_info["label_names"] = {label["name"] for label in pr_info.get("labels", [])}
+        return pr_info
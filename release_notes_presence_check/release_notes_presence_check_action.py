@@ -21,14 +21,108 @@ This module contains the Release Notes Presence Check action.
 import logging
 import os
 import re
+from typing import Mapping, NoReturn, Optional
 
 from release_notes_presence_check.github_repository import GitHubRepository
 from release_notes_presence_check.utils.gh_action import set_action_failed, get_action_input
 
 logger = logging.getLogger(__name__)
 
+# MULTILINE keeps `^` and `$` in the title anchored to the line containing the tag
+_TITLE_FLAGS = re.MULTILINE
+_DEFAULT_TITLE = "[Rr]elease [Nn]otes:"
+_DEFAULT_TITLE_RE = re.compile(_DEFAULT_TITLE, _TITLE_FLAGS)
+_NON_WHITESPACE_RE = re.compile(r"\S")
+# a title without any of these characters is a plain literal and can be located with str.find
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+# a quantifier applied to an expression that is itself quantified, e.g. `(a+)+`, can backtrack exponentially
+_BRACE_QUANTIFIER_RE = re.compile(r"\{(\d*)(,?)(\d*)\}")
 
-# pylint: disable=too-few-public-methods
+
+def _read_quantifier(pattern: str, pos: int) -> tuple[int, bool]:
+    """
+    Read the quantifier, if any, at the given position of a regex pattern.
+
+    @param pattern: The regex pattern.
+    @param pos: The position right after an atom or a group.
+    @return: tuple[int, bool] - The position after the quantifier and whether it allows more than one repetition.
+    """
+    if pos >= len(pattern):
+        return pos, False
+
+    if pattern[pos] in "*+?":
+        end, repeats = pos + 1, pattern[pos] != "?"
+    else:
+        brace = _BRACE_QUANTIFIER_RE.match(pattern, pos)
+        if not brace or not any(brace.groups()):
+            return pos, False
+        minimum, comma, maximum = brace.groups()
+        end = brace.end()
+        repeats = (not maximum or int(maximum) > 1) if comma else int(minimum) > 1
+
+    # lazy `?` or possessive `+` modifier
+    if end < len(pattern) and pattern[end] in "?+":
+        end += 1
+    return end, repeats
+
+
+def _skip_character_class(pattern: str, pos: int) -> int:
+    """
+    Skip the character class starting at the given position of a regex pattern.
+
+    @param pattern: The regex pattern.
+    @param pos: The position of the opening `[`.
+    @return: The position after the closing `]`.
+    """
+    pos += 1
+    if pos < len(pattern) and pattern[pos] == "^":
+        pos += 1
+    # a `]` right after the opening bracket is a literal
+    if pos < len(pattern) and pattern[pos] == "]":
+        pos += 1
+    while pos < len(pattern) and pattern[pos] != "]":
+        pos += 2 if pattern[pos] == "\\" else 1
+    return pos + 1
+
+
+def _has_nested_quantifier(pattern: str) -> bool:
+    """
+    Check whether a regex pattern repeats a group which itself contains a repeat.
+
+    @param pattern: The regex pattern, expected to compile.
+    @return: True if a nested quantifier is present.
+    """
+    # one entry per open group, telling whether a repeat was seen inside it
+    group_has_repeat = [False]
+    pos = 0
+    while pos < len(pattern):
+        char = pattern[pos]
+        if char == "(":
+            group_has_repeat.append(False)
+            # `(?` starts a group extension, its `?` is not a quantifier
+            pos += 2 if pattern.startswith("(?", pos) else 1
+            continue
+
+        if char == ")" and len(group_has_repeat) > 1:
+            inner_has_repeat = group_has_repeat.pop()
+            pos, repeats = _read_quantifier(pattern, pos + 1)
+            if inner_has_repeat and repeats:
+                return True
+            group_has_repeat[-1] = group_has_repeat[-1] or inner_has_repeat or repeats
+            continue
+
+        if char == "\\":
+            pos += 2
+        elif char == "[":
+            pos = _skip_character_class(pattern, pos)
+        else:
+            pos += 1
+        pos, repeats = _read_quantifier(pattern, pos)
+        group_has_repeat[-1] = group_has_repeat[-1] or repeats
+    return False
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
 class ReleaseNotesPresenceCheckAction:
     """
     Class to handle the Release Notes Presence Check action.
@@ -40,17 +134,23 @@ class ReleaseNotesPresenceCheckAction:
 
         @return: None
         """
+        env: Mapping[str, str] = os.environ
+
         self.github_token: str = get_action_input("GITHUB_TOKEN", "")
         self.location: str = get_action_input("LOCATION", "body")
-        self.title: str = get_action_input("TITLE", "[Rr]elease [Nn]otes:")
-        self.skip_labels: list[str] = get_action_input("SKIP_LABELS", default="").split(",")
+        self.title: str = get_action_input("TITLE", _DEFAULT_TITLE)
+        raw_skip_labels_input: str = get_action_input("SKIP_LABELS", default="")
+        self.skip_labels: frozenset[str] = frozenset(
+            label for label in (item.strip() for item in raw_skip_labels_input.split(",")) if label
+        )
         raw_placeholder_input: str = get_action_input("SKIP_PLACEHOLDERS", default="")
         self.skip_placeholders: set[str] = {p for p in (item.strip() for item in raw_placeholder_input.split(",")) if p}
 
-        self.__validate_inputs()
+        self.owner, self.repo_name, self._title_re = self.__validate_inputs(env)
+        self._title_literal: Optional[str] = None if _REGEX_METACHARACTERS.intersection(self.title) else self.title
 
-        self.pr_number: int = int(os.environ.get("INPUT_PR_NUMBER", default=""))
-        self.owner, self.repo_name = os.environ.get("INPUT_GITHUB_REPOSITORY", default="").split("/")
+        self.pr_number: int = int(env.get("INPUT_PR_NUMBER", ""))
+        self.repository: GitHubRepository = GitHubRepository(self.owner, self.repo_name, self.github_token)
 
     def run(self) -> tuple[bool, str]:
         """
@@ -60,104 +160,122 @@ class ReleaseNotesPresenceCheckAction:
         """
 
         # get PR information
-        repository: GitHubRepository = GitHubRepository(self.owner, self.repo_name, self.github_token)
-        pr_data: dict = repository.get_pr_info(self.pr_number)
+        pr_data: dict = self.repository.get_pr_info(self.pr_number)
+
+        logger.debug("PR number: %s", self.pr_number)
 
-        # check skip labels presence
-        labels: list[str] = [label.get("name", "") for label in pr_data.get("labels", [])]
-        logger.debug("PR number: %s, labels: %s", self.pr_number, labels)
-        for label in labels:
-            if label in self.skip_labels:
-                return True, f"Skipping release notes check because '{label}' label is present."
+        # check skip labels presence, PR labels are not needed when no skip labels are configured
+        if self.skip_labels:
+            labels: set[str] = pr_data["label_names"]
+            logger.debug("PR labels: %s", labels)
+            present_skip_labels = labels & self.skip_labels
+            if present_skip_labels:
+                return True, f"Skipping release notes check because '{min(present_skip_labels)}' label is present."
 
         # check release notes presence in defined location
-        pr_body = pr_data.get("body", "")
-        if len(pr_body.strip()) == 0:
+        pr_body: str = pr_data.get("body") or ""
+        if not pr_body or pr_body.isspace():
             return False, "Error: Pull request description is empty."
 
+        # bodies written in the GitHub web editor use CRLF, `$` in a MULTILINE title only matches before `\n`
+        pr_body = pr_body.replace("\r\n", "\n")
         logger.debug("PR body: %s", pr_body)
 
         # Check if release notes tag is present
-        if not re.search(self.title, pr_body):
+        title_span = self.__find_title(pr_body)
+        if title_span is None:
             return False, f"Error: Release notes title '{self.title}' not found in pull request body."
 
-        # remove empty lines from body
-        pr_body_filtered = "\n".join(line for line in pr_body.split("\n") if line.strip())
+        # the title may match surrounding whitespace or newlines, the tag line is the one holding its last visible char
+        title_start, title_end = title_span
+        title_last_char = title_start + len(pr_body[title_start:title_end].rstrip()) - 1
 
-        # Get line index of the release notes tag
-        lines = pr_body_filtered.split("\n")
-        release_notes_start_index = None
-        for i, line in enumerate(lines):
-            if re.search(self.title, line):
-                release_notes_start_index = i + 1  # text after the tag line
-                break
+        # Skip the rest of the tag line and any empty lines below it
+        tag_line_end = pr_body.find("\n", max(title_start, title_last_char))
+        content_match = _NON_WHITESPACE_RE.search(pr_body, tag_line_end + 1) if tag_line_end != -1 else None
 
         # Check if there is content after the release notes tag
-        if release_notes_start_index is None or release_notes_start_index >= len(lines):
+        if not content_match:
             return False, "Error: No content found after the release notes tag."
 
         # Check if there is a bullet list directly under the release notes tag
-        text_below_release_notes = lines[release_notes_start_index:]
-        if not text_below_release_notes or not text_below_release_notes[0].strip().startswith(("-", "+", "*")):
+        first_line_end = pr_body.find("\n", content_match.start())
+        first_line = pr_body[content_match.start() : first_line_end if first_line_end != -1 else None]
+        # first_line starts at its first non-whitespace character, so only that character needs checking
+        if first_line[0] not in "-+*":
             return False, "Error: No bullet list found directly under release notes tag."
 
         # Check for placeholder values in the first bullet point (single regex pass)
-        bullet_match = re.match(r"^\s*[-+*]\s*([A-Za-z0-9_]+)", text_below_release_notes[0])
+        bullet_match = re.match(r"^\s*[-+*]\s*([A-Za-z0-9_]+)", first_line)
         if bullet_match and bullet_match.group(1) in self.skip_placeholders:
             return False, "Error: Placeholder release notes found. Replace template values."
 
         return True, "Release Notes detected."
 
-    def __validate_inputs(self) -> None:
+    def __find_title(self, pr_body: str) -> Optional[tuple[int, int]]:
         """
-        Validate the required inputs. When the inputs are not valid, the action will fail.
+        Find the release notes title in the PR body. Plain literal titles skip the regex engine.
 
-        @return: None
+        @param pr_body: The PR body to search.
+        @return: The start and end index of the title, or None when it is not present.
         """
-        error_detected = False
+        if self._title_literal is not None:
+            title_start = pr_body.find(self._title_literal)
+            return (title_start, title_start + len(self._title_literal)) if title_start != -1 else None
 
-        if len(self.github_token) == 0:
-            logger.error("Failure: GITHUB_TOKEN is not set correctly.")
-            error_detected = True
-
-        value = os.environ.get("INPUT_PR_NUMBER", default="")
-        if len(value) == 0:
-            logger.error("Failure: PR_NUMBER is not set correctly.")
-            error_detected = True
-
-        if not value.isdigit():
-            logger.error("Failure: PR_NUMBER is not a valid number.")
-            error_detected = True
-
-        value = os.environ.get("INPUT_GITHUB_REPOSITORY", default="")
-        if len(value) == 0:
-            logger.error("Failure: GITHUB_REPOSITORY is not set correctly.")
-            error_detected = True
-
-        if value.count("/") != 1:
-            logger.error("Failure: GITHUB_REPOSITORY is not in the correct format.")
-            error_detected = True
-        else:
-            if len(value.split("/")[0]) == 0 or len(value.split("/")[1]) == 0:
-                logger.error("Failure: GITHUB_REPOSITORY is not in the correct format.")
-                error_detected = True
+        title_match = self._title_re.search(pr_body)
+        return title_match.span() if title_match else None
 
-        if len(self.location) == 0:
-            logger.error("Failure: LOCATION is not set correctly.")
-            error_detected = True
+    def __validate_inputs(self, env: Mapping[str, str]) -> tuple[str, str, re.Pattern[str]]:
+        """
+        Validate the required inputs. The action fails on the first invalid input.
 
-        if self.location not in ["body"]:
-            logger.error("Failure: LOCATION is not one of the supported values.")
-            error_detected = True
+        @param env: The environment mapping to read the inputs from.
+        @return: tuple[str, str, re.Pattern[str]] - The repository owner, the repository name and the compiled title.
+        """
 
-        if len(self.title) == 0:
-            logger.error("Failure: TITLE is not set correctly.")
-            error_detected = True
+        def fail(message: str) -> NoReturn:
+            logger.error(message)
+            set_action_failed("Inputs validation failed.")
 
         logger.debug("Input - `location`: %s", self.location)
         logger.debug("Input - `title`: %s", self.title)
         logger.debug("Input - `skip_labels`: %s", self.skip_labels)
         logger.debug("Input - `skip_placeholders`: %s", self.skip_placeholders)
 
-        if error_detected:
-            set_action_failed("Inputs validation failed.")
+        if len(self.github_token) == 0:
+            fail("Failure: GITHUB_TOKEN is not set correctly.")
+
+        pr_number_raw = env.get("INPUT_PR_NUMBER", "")
+        if len(pr_number_raw) == 0:
+            fail("Failure: PR_NUMBER is not set correctly.")
+
+        if not pr_number_raw.isdigit():
+            fail("Failure: PR_NUMBER is not a valid number.")
+
+        repository_raw = env.get("INPUT_GITHUB_REPOSITORY", "")
+        if len(repository_raw) == 0:
+            fail("Failure: GITHUB_REPOSITORY is not set correctly.")
+
+        repository_parts = repository_raw.split("/", 2)
+        if len(repository_parts) != 2 or not repository_parts[0] or not repository_parts[1]:
+            fail("Failure: GITHUB_REPOSITORY is not in the correct format.")
+
+        if len(self.location) == 0:
+            fail("Failure: LOCATION is not set correctly.")
+
+        if self.location not in ["body"]:
+            fail("Failure: LOCATION is not one of the supported values.")
+
+        if len(self.title) == 0:
+            fail("Failure: TITLE is not set correctly.")
+
+        try:
+            title_re = _DEFAULT_TITLE_RE if self.title == _DEFAULT_TITLE else re.compile(self.title, _TITLE_FLAGS)
+        except re.error as e:
+            fail(f"Failure: TITLE is not a valid regular expression: {e}")
+
+        if self.title != _DEFAULT_TITLE and _has_nested_quantifier(self.title):
+            fail("Failure: TITLE contains nested quantifiers, which are not supported.")
+
+        return repository_parts[0], repository_parts[1], title_re
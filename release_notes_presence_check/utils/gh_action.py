@@ -20,7 +20,7 @@ This module provides utilities for GitHub Actions.
 
 import os
 import sys
-from typing import Optional
+from typing import NoReturn, Optional
 
 
 def get_action_input(name: str, default: Optional[str] = None) -> str:
@@ -35,12 +35,12 @@ def get_action_input(name: str, default: Optional[str] = None) -> str:
     return os.getenv(f'INPUT_{name.replace("-", "_").upper()}', default=default if default else "")
 
 
-def set_action_failed(message: str) -> None:
+def set_action_failed(message: str) -> NoReturn:
     """
     Mark the GitHub Action as failed and exit with an error message.
 
     @param message: The error message to be displayed.
-    @return: None
+    @return: Does not return, the process exits with code 1.
     """
     print(f"::error::{message}")
     sys.exit(1)
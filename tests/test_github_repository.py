@@ -0,0 +1,63 @@
+#
+# Copyright 2024 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from release_notes_presence_check.github_repository import GitHubRepository
+
+
+def mock_response(mocker, status_code, json_data=None):
+    response = mocker.Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data
+    return response
+
+
+# get_pr_info
+
+def test_get_pr_info_label_names(mocker):
+    mock_get = mocker.patch("release_notes_presence_check.github_repository.requests.get")
+    mock_get.return_value = mock_response(
+        mocker,
+        200,
+        {"body": "", "labels": [{"name": "bug", "color": "d73a4a"}, {"name": "skip-release-notes-check"}]},
+    )
+
+    pr_info = GitHubRepository("owner", "repo", "fake_token").get_pr_info(109)
+
+    assert {"bug", "skip-release-notes-check"} == pr_info["label_names"]
+
+
+def test_get_pr_info_label_names_without_labels(mocker):
+    mock_get = mocker.patch("release_notes_presence_check.github_repository.requests.get")
+    mock_get.return_value = mock_response(mocker, 200, {"body": ""})
+
+    pr_info = GitHubRepository("owner", "repo", "fake_token").get_pr_info(109)
+
+    assert set() == pr_info["label_names"]
+
+
+
+def test_get_pr_info_failure_fails_action(mocker, capsys):
+    mock_get = mocker.patch("release_notes_presence_check.github_repository.requests.get")
+    mock_get.return_value = mock_response(mocker, 404)
+
+    repository = GitHubRepository("owner", "repo", "fake_token")
+    with pytest.raises(SystemExit) as e:
+        repository.get_pr_info(109)
+
+    assert 1 == e.value.code
+    assert "::error::Error fetching PR details. Status code: 404" in capsys.readouterr().out
+    mock_get.return_value.json.assert_not_called()
@@ -68,6 +68,12 @@ def test_validate_inputs_valid(monkeypatch, caplog):
 
     # TITLE missing or empty
     ("INPUT_TITLE", "", "Failure: TITLE is not set correctly."),
+    ("INPUT_TITLE", "[Rr]elease (Notes:", "Failure: TITLE is not a valid regular expression"),
+    ("INPUT_TITLE", "([Rr]elease +)+[Nn]otes:", "Failure: TITLE contains nested quantifiers"),
+    ("INPUT_TITLE", "(\\s*)*Release Notes:", "Failure: TITLE contains nested quantifiers"),
+    ("INPUT_TITLE", "((a+))+Release Notes:", "Failure: TITLE contains nested quantifiers"),
+    ("INPUT_TITLE", "(x|(a*b)+)*Release Notes:", "Failure: TITLE contains nested quantifiers"),
+    ("INPUT_TITLE", "(?:a{2,})+Release Notes:", "Failure: TITLE contains nested quantifiers"),
 ])
 def test_validate_inputs_invalid(monkeypatch, caplog, env_name, env_value, error_message):
     # Set all required valid environment variables
@@ -106,6 +112,69 @@ def test_validate_inputs_invalid(monkeypatch, caplog, env_name, env_value, error
     assert error_message in caplog.text, f"Expected error message '{error_message}' for {env_name}={env_value}"
 
 
+@pytest.mark.parametrize("title", [
+    "(\\*\\*)*Release Notes:(\\*\\*)*",
+    "([-+*] )*Release Notes:",
+    "(#+ )?[Rr]elease [Nn]otes:",
+    "(a?)+Release Notes:",
+    "([]+*]+ )?Release Notes:",
+])
+def test_validate_inputs_title_without_nested_quantifiers(caplog, title):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": title,
+        "INPUT_SKIP_LABELS": "",
+    }
+    os.environ.update(env_vars)
+    caplog.set_level(logging.ERROR)
+
+    ReleaseNotesPresenceCheckAction()
+
+    assert "Failure" not in caplog.text
+
+
+def test_validate_inputs_stops_on_first_error(caplog):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "",
+        "INPUT_GITHUB_REPOSITORY": "ownerrepo",
+        "INPUT_PR_NUMBER": "abc",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": "[Rr]elease [Nn]otes:",
+        "INPUT_SKIP_LABELS": "",
+    }
+    os.environ.update(env_vars)
+
+    with pytest.raises(SystemExit) as e:
+        caplog.set_level(logging.ERROR)
+        ReleaseNotesPresenceCheckAction()
+
+    assert e.value.code == 1
+    assert "Failure: GITHUB_TOKEN is not set correctly." in caplog.text
+    assert "PR_NUMBER" not in caplog.text
+    assert "GITHUB_REPOSITORY" not in caplog.text
+
+
+def test_title_regex_default_is_reused(monkeypatch):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_LOCATION": "body",
+        "INPUT_SKIP_LABELS": "",
+    }
+    os.environ.update(env_vars)
+    monkeypatch.delenv("INPUT_TITLE", raising=False)
+
+    first = ReleaseNotesPresenceCheckAction()
+    second = ReleaseNotesPresenceCheckAction()
+
+    assert first._title_re is second._title_re
+    assert first._title_re.pattern == "[Rr]elease [Nn]otes:"
+
+
 # run
 
 def test_run_successful(mocker):
@@ -132,7 +201,8 @@ def test_run_successful(mocker):
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
         "body": "Release Notes:\n- This update includes bug fixes and improvements.",
-        "labels": [{"name": "bug"}, {"name": "enhancement"}]
+        "labels": [{"name": "bug"}, {"name": "enhancement"}],
+        "label_names": {"bug", "enhancement"}
     }
 
     # Run the action
@@ -167,7 +237,8 @@ def test_run_skip_by_label(mocker):
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
         "body": "Release Notes:\n- This update includes bug fixes and improvements.",
-        "labels": [{"name": "bug"}, {"name": "enhancement"}, {"name": "skip-release-notes-check"}]
+        "labels": [{"name": "bug"}, {"name": "enhancement"}, {"name": "skip-release-notes-check"}],
+        "label_names": {"bug", "enhancement", "skip-release-notes-check"}
     }
 
     # Run the action
@@ -201,7 +272,8 @@ def test_run_fail_no_body(mocker):
     mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
-        "labels": [{"name": "bug"}, {"name": "enhancement"}]
+        "labels": [{"name": "bug"}, {"name": "enhancement"}],
+        "label_names": {"bug", "enhancement"}
     }
 
     # Run the action
@@ -212,7 +284,8 @@ def test_run_fail_no_body(mocker):
     assert "Error: Pull request description is empty." == message
 
 
-def test_run_fail_empty_body(mocker):
+@pytest.mark.parametrize("body", ["", None, " \n\t\n"])
+def test_run_fail_empty_body(mocker, body):
     # Set environment variables
     env_vars = {
         "INPUT_GITHUB_TOKEN": "fake_token",
@@ -235,8 +308,9 @@ def test_run_fail_empty_body(mocker):
     mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
-        "body": "",
-        "labels": [{"name": "bug"}, {"name": "enhancement"}]
+        "body": body,
+        "labels": [{"name": "bug"}, {"name": "enhancement"}],
+        "label_names": {"bug", "enhancement"}
     }
 
     # Run the action
@@ -271,7 +345,8 @@ def test_run_fail_title_not_found(mocker):
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
         "body": "Release Notes:\n- This update includes bug fixes and improvements.",
-        "labels": [{"name": "bug"}, {"name": "enhancement"}]
+        "labels": [{"name": "bug"}, {"name": "enhancement"}],
+        "label_names": {"bug", "enhancement"}
     }
 
     # Run the action
@@ -306,7 +381,8 @@ def test_run_fail_release_notes_lines_not_found(mocker):
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
         "body": "Release Notes:\nThis update includes bug fixes and improvements.",
-        "labels": [{"name": "bug"}, {"name": "enhancement"}]
+        "labels": [{"name": "bug"}, {"name": "enhancement"}],
+        "label_names": {"bug", "enhancement"}
     }
 
     # Run the action
@@ -341,7 +417,8 @@ def test_run_fail_no_lines_after_title(mocker):
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
         "body": "Release Notes:",
-        "labels": [{"name": "bug"}, {"name": "enhancement"}]
+        "labels": [{"name": "bug"}, {"name": "enhancement"}],
+        "label_names": {"bug", "enhancement"}
     }
 
     # Run the action
@@ -372,10 +449,188 @@ def test_run_fail_placeholder(mocker):
     mock_repository_instance = mock_repository_class.return_value
     mock_repository_instance.get_pr_info.return_value = {
         "body": "Release Notes:\n- To_Do: 1st item\n- TBD: 2nd item",
-        "labels": [{"name": "bug"}]
+        "labels": [{"name": "bug"}],
+        "label_names": {"bug"}
     }
 
     action = ReleaseNotesPresenceCheckAction()
     status, message = action.run()
     assert status is False
     assert "Placeholder release notes found" in message
+
+
+def test_run_successful_empty_lines_below_title(mocker):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": "[Rr]elease [Nn]otes:",
+        "INPUT_SKIP_LABELS": "",
+        "INPUT_SKIP_PLACEHOLDERS": "",
+        "INPUT_FAILS_ON_ERROR": "true",
+    }
+    os.environ.update(env_vars)
+
+    mocker.patch("sys.exit", side_effect=SystemExit(1))
+    mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
+    mock_repository_instance = mock_repository_class.return_value
+    mock_repository_instance.get_pr_info.return_value = {
+        "body": "## Overview\nSome text.\n\n## Release Notes:\n\n  \n  - Fixed the parser.\n- Second item",
+        "labels": [{"name": "bug"}],
+        "label_names": {"bug"}
+    }
+
+    action = ReleaseNotesPresenceCheckAction()
+    status, message = action.run()
+    assert status is True
+    assert "Release Notes detected." == message
+
+
+@pytest.mark.parametrize("body", [
+    "See ## Release Notes below.\n## Release Notes\n- Fixed the parser.",
+    "See ## Release Notes below.\r\n## Release Notes\r\n- Fixed the parser.\r\n",
+])
+def test_run_successful_title_anchored_to_line(mocker, body):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": "^## Release Notes$",
+        "INPUT_SKIP_LABELS": "",
+        "INPUT_SKIP_PLACEHOLDERS": "",
+        "INPUT_FAILS_ON_ERROR": "true",
+    }
+    os.environ.update(env_vars)
+
+    mocker.patch("sys.exit", side_effect=SystemExit(1))
+    mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
+    mock_repository_instance = mock_repository_class.return_value
+    mock_repository_instance.get_pr_info.return_value = {
+        "body": body,
+        "labels": [{"name": "bug"}],
+        "label_names": {"bug"}
+    }
+
+    action = ReleaseNotesPresenceCheckAction()
+    status, message = action.run()
+    assert status is True
+    assert "Release Notes detected." == message
+
+
+def test_run_skip_by_label_with_spaces_in_input(mocker):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": "[Rr]elease [Nn]otes:",
+        "INPUT_SKIP_LABELS": "no-release-notes, skip-release-notes-check ,",
+        "INPUT_FAILS_ON_ERROR": "true",
+    }
+    os.environ.update(env_vars)
+
+    mocker.patch("sys.exit", side_effect=SystemExit(0))
+    mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
+    mock_repository_instance = mock_repository_class.return_value
+    mock_repository_instance.get_pr_info.return_value = {
+        "body": "",
+        "labels": [{"name": "bug"}, {"name": "skip-release-notes-check"}],
+        "label_names": {"bug", "skip-release-notes-check"}
+    }
+
+    action = ReleaseNotesPresenceCheckAction()
+    status, message = action.run()
+
+    assert action.skip_labels == frozenset({"no-release-notes", "skip-release-notes-check"})
+    assert True == status
+    assert "Skipping release notes check because 'skip-release-notes-check' label is present." == message
+
+
+
+def test_run_fail_only_whitespace_after_title(mocker):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": "[Rr]elease [Nn]otes:",
+        "INPUT_SKIP_LABELS": "",
+        "INPUT_FAILS_ON_ERROR": "true",
+    }
+    os.environ.update(env_vars)
+
+    mocker.patch("sys.exit", side_effect=SystemExit(1))
+    mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
+    mock_repository_instance = mock_repository_class.return_value
+    mock_repository_instance.get_pr_info.return_value = {
+        "body": "Release Notes: - not a bullet on the tag line\n\n   \n\t\n",
+        "labels": [{"name": "bug"}],
+        "label_names": {"bug"}
+    }
+
+    action = ReleaseNotesPresenceCheckAction()
+    status, message = action.run()
+    assert status is False
+    assert "Error: No content found after the release notes tag." == message
+
+
+def test_run_successful_literal_title(mocker):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": "## Release Notes:",
+        "INPUT_SKIP_LABELS": "",
+        "INPUT_SKIP_PLACEHOLDERS": "",
+        "INPUT_FAILS_ON_ERROR": "true",
+    }
+    os.environ.update(env_vars)
+
+    mocker.patch("sys.exit", side_effect=SystemExit(1))
+    mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
+    mock_repository_instance = mock_repository_class.return_value
+    mock_repository_instance.get_pr_info.return_value = {
+        "body": "## release notes:\nnot it\n## Release Notes:\n- Fixed the parser.",
+        "labels": [{"name": "bug"}],
+        "label_names": {"bug"}
+    }
+
+    action = ReleaseNotesPresenceCheckAction()
+    status, message = action.run()
+    assert action._title_literal == "## Release Notes:"
+    assert status is True
+    assert "Release Notes detected." == message
+
+
+@pytest.mark.parametrize(
+    "title", ["\\s*Release Notes:", "\\s*[Rr]elease [Nn]otes:", "(?s).*Release Notes:", "Release Notes:\\s*"]
+)
+def test_run_successful_title_matching_surrounding_whitespace(mocker, title):
+    env_vars = {
+        "INPUT_GITHUB_TOKEN": "fake_token",
+        "INPUT_PR_NUMBER": "109",
+        "INPUT_GITHUB_REPOSITORY": "owner/repo",
+        "INPUT_LOCATION": "body",
+        "INPUT_TITLE": title,
+        "INPUT_SKIP_LABELS": "",
+        "INPUT_SKIP_PLACEHOLDERS": "",
+        "INPUT_FAILS_ON_ERROR": "true",
+    }
+    os.environ.update(env_vars)
+
+    mocker.patch("sys.exit", side_effect=SystemExit(1))
+    mock_repository_class = mocker.patch("release_notes_presence_check.release_notes_presence_check_action.GitHubRepository")
+    mock_repository_instance = mock_repository_class.return_value
+    mock_repository_instance.get_pr_info.return_value = {
+        "body": "Intro\nRelease Notes:\n- a",
+        "labels": [{"name": "bug"}],
+        "label_names": {"bug"}
+    }
+
+    action = ReleaseNotesPresenceCheckAction()
+    status, message = action.run()
+    assert status is True
+    assert "Release Notes detected." == message